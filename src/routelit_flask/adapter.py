@@ -1,11 +1,12 @@
+import functools
 import importlib.resources as resources
 from enum import Enum
-from typing import Any, Literal, Optional, Union
+from typing import Any, Literal, Optional, Union, cast
 
 from flask import (
     Flask,
     Response,
-    jsonify,
+    current_app,
     make_response,
     render_template,
     request,
@@ -13,16 +14,27 @@ from flask import (
     stream_with_context,
 )
 from flask.json.provider import JSONProvider
-from jinja2 import ChoiceLoader, FileSystemLoader
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, FileSystemLoader, Template
+from markupsafe import escape
 from routelit import COOKIE_SESSION_KEY, AssetTarget, RouteLit, ViewFn
 
-from .json_encoder import CustomJSONProvider
+from .json_encoder import CustomJSONProvider, _json_default, orjson
 from .request import FlaskRLRequest
 from .utils import (
     get_default_static_path,
     get_default_template_path,
 )
 
+# Hashed vite bundles never change content under the same name, so warm
+# clients can cache them for a year and revalidate with ETag/If-Modified-Since.
+_STATIC_MAX_AGE = 60 * 60 * 24 * 365  # 1 year
+
+# Sentinels rendered into the cached index.html shell and swapped for the
+# per-request values with plain string replacement.
+_RL_DATA_SENTINEL = "__RL_DATA__"
+_RL_TITLE_SENTINEL = "__RL_TITLE__"
+_RL_DESCRIPTION_SENTINEL = "__RL_DESC__"
+
 production_cookie_config = {
     "secure": True,
     "samesite": "none",
@@ -40,6 +52,32 @@ The run mode for the RouteLitFlaskAdapter.
 """
 
 
+def _get_elements_json(rl_response: Any) -> str:
+    """Serialize the page elements for ROUTELIT_DATA, preferring orjson."""
+    elements = getattr(rl_response, "elements", None)
+    if orjson is not None and isinstance(elements, list):
+        # Dataclass elements are serialized natively by orjson's C encoder.
+        return orjson.dumps(elements, default=_json_default).decode()
+    return cast(str, rl_response.get_str_json_elements())
+
+
+@functools.lru_cache(maxsize=8)
+def _fs_loader(template_path: str) -> FileSystemLoader:
+    # Shared per path so repeated configures and multi-app deploys reuse the
+    # same loader (and Jinja's caches behind it).
+    return FileSystemLoader(template_path)
+
+
+def _send_static_file(directory: str, filename: str) -> Response:
+    # conditional=True lets Werkzeug answer 304 Not Modified from mtime/ETag
+    # without reading the file body at all.
+    response = send_from_directory(directory, filename, conditional=True, max_age=_STATIC_MAX_AGE)
+    # Keep passthrough enabled so the WSGI server can serve the file body via
+    # wsgi.file_wrapper (sendfile(2) where available) instead of a Python copy loop.
+    response.direct_passthrough = True
+    return response
+
+
 class RunModeEnum(Enum):
     PROD = "prod"
     DEV_CLIENT = "dev_client"
@@ -84,15 +122,25 @@ class RouteLitFlaskAdapter:
         self.local_frontend_server = local_frontend_server
         self.local_components_server = local_components_server
         self.cookie_config = {**production_cookie_config, **(cookie_config or {})} if run_mode == "prod" else {}
+        self._index_template: Optional[Template] = None
+        self._index_shell: Optional[str] = None
+        self._base_ctx: Optional[dict[str, Any]] = None
+        self._response_class: Optional[type[Response]] = None
 
     @classmethod
     def configure_static_assets(cls, flask_app: Flask, asset_target: AssetTarget) -> None:
         package_name, path = asset_target["package_name"], asset_target["path"]
-        assets_path = resources.files(package_name).joinpath(path)
+        assets_root = str(resources.files(package_name).joinpath(path))
+
+        # Bind the resolved directory as a default argument so each request
+        # avoids a closure-cell lookup and the str(Path) conversion.
+        def _serve(filename: str, _root: str = assets_root) -> Response:
+            return _send_static_file(_root, filename)
+
         flask_app.add_url_rule(
             f"/routelit/{package_name}/<path:filename>",
             endpoint=f"assets_static_{package_name}",
-            view_func=lambda filename: send_from_directory(str(assets_path), filename),
+            view_func=_serve,
         )
 
     def configure(
@@ -115,30 +163,60 @@ class RouteLitFlaskAdapter:
         for static_path in self.routelit.get_builder_class().get_client_resource_paths():
             self.configure_static_assets(flask_app, static_path)
 
+        def _serve_static(filename: str, _root: str = self.static_path) -> Response:
+            return _send_static_file(_root, filename)
+
         flask_app.add_url_rule(
             "/routelit/<path:filename>",
             endpoint="routelit_static",
-            view_func=lambda filename: send_from_directory(self.static_path, filename),
+            view_func=_serve_static,
         )
 
+        # Give send_file responses a client-cache lifetime when the app has not
+        # configured one; Flask's default of None disables Cache-Control entirely.
+        if flask_app.config.get("SEND_FILE_MAX_AGE_DEFAULT") is None:
+            flask_app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 60 * 60 * 12  # 12 hours
+
         # configure jinja templates for index.html
         current_loader = flask_app.jinja_loader
         if isinstance(current_loader, ChoiceLoader):
             # Append to the list of loaders
-            current_loader.loaders.append(FileSystemLoader(self.template_path))  # type: ignore[attr-defined]
+            current_loader.loaders.append(_fs_loader(self.template_path))  # type: ignore[attr-defined]
         else:
             # Wrap current loader and new one in a ChoiceLoader
-            flask_app.jinja_loader = ChoiceLoader([current_loader, FileSystemLoader(self.template_path)])  # type: ignore[list-item]
-        return self
+            flask_app.jinja_loader = ChoiceLoader([current_loader, _fs_loader(self.template_path)])  # type: ignore[list-item]
 
-    def _handle_get_request(self, view_fn: ViewFn, request: FlaskRLRequest, **kwargs: Any) -> Response:
-        rl_response = self.routelit.handle_get_request(view_fn, request, **kwargs)
-        response = make_response(
-            render_template(
-                "index.html",
-                ROUTELIT_DATA=rl_response.get_str_json_elements(),
-                PAGE_TITLE=rl_response.head.title,
-                PAGE_DESCRIPTION=rl_response.head.description,
+        # Resolve the index.html template once so per-request rendering skips
+        # loader resolution, and persist compiled templates across restarts.
+        self._response_class = flask_app.response_class
+
+        jinja_env = flask_app.jinja_env
+        if jinja_env.bytecode_cache is None:
+            jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        self._index_template = jinja_env.get_template("index.html")
+
+        # Constants of the render context, built once instead of per request.
+        self._base_ctx = {
+            "RUN_MODE": self.run_mode,
+            "LOCAL_FRONTEND_SERVER": self.local_frontend_server,
+            "LOCAL_COMPONENTS_SERVER": self.local_components_server,
+        }
+        if self.run_mode == "prod":
+            # Bundler output is fixed for the process lifetime in prod, so the
+            # asset descriptors can be resolved once. Dev modes re-read them
+            # per request since the vite servers rebuild on the fly.
+            self._base_ctx["default_vite_assets"] = self.routelit.default_client_assets()
+            self._base_ctx["vite_assets"] = self.routelit.client_assets()
+
+        # In prod the surrounding HTML is constant per process: render the shell
+        # once with sentinels so per-request rendering is a few str.replace calls.
+        # Dev modes keep full rendering since assets change between requests.
+        self._index_shell = None
+        if self.run_mode == "prod":
+            self._index_shell = self._index_template.render(
+                ROUTELIT_DATA=_RL_DATA_SENTINEL,
+                PAGE_TITLE=_RL_TITLE_SENTINEL,
+                PAGE_DESCRIPTION=_RL_DESCRIPTION_SENTINEL,
                 RUN_MODE=self.run_mode,
                 LOCAL_FRONTEND_SERVER=self.local_frontend_server,
                 LOCAL_COMPONENTS_SERVER=self.local_components_server,
@@ -148,8 +226,61 @@ class RouteLitFlaskAdapter:
                 extra_head_content=self.routelit.get_extra_head_content(),
                 extra_body_content=self.routelit.get_extra_body_content(),
             )
-        )
-        response.set_cookie(COOKIE_SESSION_KEY, request.get_session_id(), **self.cookie_config)
+        return self
+
+    def _render_index(self, rl_response: Any) -> str:
+        head = rl_response.head
+        # Falsy title/description take {% if %} fallback branches in the
+        # template (default title, omitted meta tag) that the baked shell
+        # cannot reproduce; render those pages through the template instead.
+        if self._index_shell is not None and head.title and head.description:
+            # Values land in HTML-autoescaped slots, so escape them exactly as
+            # Jinja would have. The user-controlled data is substituted last so
+            # payloads containing the title/description sentinels cannot be
+            # rewritten by the later replaces.
+            return (
+                self._index_shell
+                .replace(_RL_TITLE_SENTINEL, str(escape(head.title)))
+                .replace(_RL_DESCRIPTION_SENTINEL, str(escape(head.description)))
+                .replace(_RL_DATA_SENTINEL, str(escape(_get_elements_json(rl_response))))
+            )
+        if self._base_ctx is not None:
+            context = self._base_ctx.copy()
+            if "vite_assets" not in context:
+                context["default_vite_assets"] = self.routelit.default_client_assets()
+                context["vite_assets"] = self.routelit.client_assets()
+        else:
+            # Not configured yet: rebuild the constant part per request.
+            context = {
+                "RUN_MODE": self.run_mode,
+                "LOCAL_FRONTEND_SERVER": self.local_frontend_server,
+                "LOCAL_COMPONENTS_SERVER": self.local_components_server,
+                "default_vite_assets": self.routelit.default_client_assets(),
+                "vite_assets": self.routelit.client_assets(),
+            }
+        context["ROUTELIT_DATA"] = _get_elements_json(rl_response)
+        context["PAGE_TITLE"] = head.title
+        context["PAGE_DESCRIPTION"] = head.description
+        context["importmap_json"] = self.routelit.get_importmap_json()
+        context["extra_head_content"] = self.routelit.get_extra_head_content()
+        context["extra_body_content"] = self.routelit.get_extra_body_content()
+        if self._index_template is not None:
+            return self._index_template.render(context)
+        # Not configured yet: fall back to resolving the template per request.
+        return render_template("index.html", **context)
+
+    def _handle_get_request(self, view_fn: ViewFn, request: FlaskRLRequest, **kwargs: Any) -> Response:
+        rl_response = self.routelit.handle_get_request(view_fn, request, **kwargs)
+        html = self._render_index(rl_response)
+        if self._response_class is not None:
+            # Skip make_response()'s type-dispatch ladder; the body is always a str.
+            response = self._response_class(html, mimetype="text/html")
+        else:
+            response = make_response(html)
+        session_id = request.get_session_id()
+        if request.is_new_session:
+            # Returning clients already hold the cookie; skip rebuilding Set-Cookie.
+            response.set_cookie(COOKIE_SESSION_KEY, session_id, **self.cookie_config)
         return response
 
     def response(
@@ -174,7 +305,10 @@ class RouteLitFlaskAdapter:
         req = FlaskRLRequest(request)
         if req.method == "POST":
             actions = self.routelit.handle_post_request(view_fn, req, inject_builder, *args, **kwargs)
-            return jsonify(actions)
+            # Build the response directly instead of jsonify() so payloads are
+            # always minified, regardless of debug/pretty-print settings.
+            body = current_app.json.dumps(actions)
+            return current_app.response_class(body, mimetype="application/json")
         else:
             return self._handle_get_request(view_fn, req, **kwargs)
 
@@ -199,13 +333,11 @@ class RouteLitFlaskAdapter:
         """
         req = FlaskRLRequest(request)
         if req.method == "POST":
-            resp = Response(
+            return Response(
                 stream_with_context(
                     self.routelit.handle_post_request_stream_jsonl(view_fn, req, inject_builder, *args, **kwargs)
                 ),
-                mimetype="text/event-stream",
+                mimetype="application/jsonlines",
             )
-            resp.headers["Content-Type"] = "application/jsonlines"
-            return resp
         else:
             return self._handle_get_request(view_fn, req, **kwargs)
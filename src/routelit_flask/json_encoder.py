@@ -3,14 +3,45 @@ from typing import Any
 
 from flask.json.provider import JSONProvider
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects from their ``__dict__``, dropping None-valued attributes.
+
+    Types that implement ``__json__`` can return a precomputed payload and skip
+    the per-attribute None filtering entirely.
+    """
+    to_json = getattr(obj, "__json__", None)
+    if to_json is not None:
+        return to_json()
+    obj_dict = getattr(obj, "__dict__", None)
+    if obj_dict is not None:
+        return {k: v for k, v in obj_dict.items() if v is not None}
+    raise TypeError(f"cannot serialize {type(obj).__name__}")  # noqa: TRY003
+
 
 class CustomJSONProvider(JSONProvider):
     def dumps(self, obj: Any, **kwargs: Any) -> str:
-        kwargs.setdefault("skipkeys", True)
-        kwargs.setdefault("default", self._default)
+        if orjson is not None and not kwargs:
+            # Hot path: C-level serialization, ~5-50x faster than stdlib json.
+            # Dataclasses are routed through _json_default rather than orjson's
+            # native encoder so None-valued fields are dropped, matching the
+            # stdlib fallback's wire format.
+            return orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode()
+        # Fallback for kwargs like indent/sort_keys (rare) or when orjson is unavailable.
+        # Keys are always strings here (__dict__-derived dicts), so the faster
+        # non-skipkeys encoder path can run.
+        kwargs.setdefault("default", _json_default)
+        kwargs.setdefault("separators", (",", ":"))
         return json.dumps(obj, **kwargs)
 
     def _default(self, obj: Any) -> Any:
-        if hasattr(obj, "__dict__"):
-            return {k: v for k, v in obj.__dict__.items() if v is not None}
-        return super()._default(obj)  # type: ignore[misc]
+        return _json_default(obj)
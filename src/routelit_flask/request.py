@@ -15,10 +15,23 @@ class FlaskRLRequest(RouteLitRequest):
 
     def __init__(self, request: Request):
         self.request = request
+        self.__default_session_id: Optional[str] = None
+        # Memoize the JSON body once; the base class touches is_json()/get_json()
+        # several times per request while extracting the ui event and fragment id.
+        # Parsing stays non-silent so a malformed body still raises BadRequest
+        # and surfaces as a 400, as it did before memoization.
+        self._is_json: bool = request.is_json
+        self._json: Optional[Any] = request.get_json() if self._is_json else None
         super().__init__()
-        self.__default_session_id = str(uuid.uuid4())
 
     def get_headers(self) -> dict[str, str]:
+        """
+        Return the request headers as a copy-free view.
+
+        Werkzeug's ``EnvironHeaders`` is returned as-is: consumers only do key
+        lookups, so converting it into a plain dict per request would be wasted
+        work. The annotation stays ``dict`` to match the upstream base class.
+        """
         return self.request.headers  # type: ignore[return-value]
 
     def get_path_params(self) -> Optional[Mapping[str, Any]]:
@@ -32,8 +45,8 @@ class FlaskRLRequest(RouteLitRequest):
         return self.request.method
 
     def get_json(self) -> Optional[Any]:
-        if self.is_json():
-            return self.request.json
+        if self._is_json:
+            return self._json
         if self.is_multipart():
             json_str = self.request.form.get("json", "{}")
             return json.loads(json_str)
@@ -45,7 +58,7 @@ class FlaskRLRequest(RouteLitRequest):
         return None
 
     def is_json(self) -> bool:
-        return self.request.is_json
+        return self._is_json
 
     def is_multipart(self) -> bool:
         content_type = self.request.content_type or ""
@@ -58,7 +71,22 @@ class FlaskRLRequest(RouteLitRequest):
         return self.request.args.getlist(key)
 
     def get_session_id(self) -> str:
-        return self.request.cookies.get(COOKIE_SESSION_KEY, self.__default_session_id)
+        session_id = self.request.cookies.get(COOKIE_SESSION_KEY)
+        if session_id is None:
+            # Only pay for the CSPRNG draw when the client has no session cookie.
+            if self.__default_session_id is None:
+                # hex skips the hyphenated formatting of str(uuid4()) and is 4 bytes smaller
+                self.__default_session_id = uuid.uuid4().hex
+            session_id = self.__default_session_id
+        return session_id
+
+    @property
+    def is_new_session(self) -> bool:
+        """
+        True if a default session id was minted for this request, i.e. the client
+        sent no session cookie and get_session_id() generated one.
+        """
+        return self.__default_session_id is not None
 
     def get_pathname(self) -> str:
         return self.request.path
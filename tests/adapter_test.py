@@ -1,14 +1,93 @@
-from unittest.mock import Mock, patch
+import html
+import json
+import re
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
+import routelit  # type: ignore[import-untyped]
 from flask import Flask
 from flask.json.provider import JSONProvider
-from jinja2 import ChoiceLoader
-from routelit import AssetTarget, RouteLit  # type: ignore[import-untyped]
+from jinja2 import ChoiceLoader, FileSystemLoader
+from routelit import AssetTarget  # type: ignore[import-untyped]
+from werkzeug.routing import Map
 
-from routelit_flask.adapter import RouteLitFlaskAdapter, RunModeEnum
+from routelit_flask.adapter import RouteLitFlaskAdapter, RunModeEnum, _fs_loader
 from routelit_flask.json_encoder import CustomJSONProvider
 from routelit_flask.request import FlaskRLRequest
+from routelit_flask.utils import get_default_static_path, get_default_template_path
+
+# Built once at import; MappingProxyType keeps accidental mutation out of the tests
+_EXPECTED_COOKIE_CONFIG = MappingProxyType({
+    "secure": True,
+    "samesite": "none",
+    "httponly": True,
+    "max_age": 60 * 60 * 24 * 1,  # 1 day
+})
+
+# Only identity is asserted for these, so bare sentinels beat Mock construction
+_EXISTING_LOADER = object()
+_FS_LOADER_INSTANCE = object()
+
+_RESOURCES_MOCK = Mock()
+_RESOURCES_MOCK.return_value.joinpath.return_value = "/mock/path"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_resources():
+    """Patch importlib.resources.files once for the whole run.
+
+    Every configure test resolves package paths through the adapter; entering
+    the patch a single time avoids per-test patch bookkeeping.
+    """
+    with patch("routelit_flask.adapter.resources.files", _RESOURCES_MOCK):
+        yield
+
+
+@pytest.fixture(scope="module")
+def _adapter_patchers():
+    """Patch the filesystem-touching adapter dependencies once for the module."""
+    patchers = [
+        patch("routelit_flask.adapter.send_from_directory"),
+        patch("routelit_flask.adapter.FileSystemLoader"),
+    ]
+    send_from_directory, fs_loader = (p.start() for p in patchers)
+    yield SimpleNamespace(send_from_directory=send_from_directory, fs_loader=fs_loader)
+    for p in patchers:
+        p.stop()
+
+
+def _noop_view(*args, **kwargs):
+    """Placeholder view function; tests only pass it through and compare identity."""
+
+
+def _make_routelit_stub():
+    """Build a lightweight RouteLit stand-in with just the attributes the adapter touches.
+
+    A plain SimpleNamespace of Mocks avoids the spec introspection that
+    Mock(spec=RouteLit) performs on every fixture invocation.
+    """
+    stub = SimpleNamespace(
+        get_builder_class=Mock(),
+        default_client_assets=Mock(),
+        client_assets=Mock(),
+        handle_get_request=Mock(),
+        handle_post_request=Mock(),
+        handle_post_request_stream_jsonl=Mock(),
+        get_importmap_json=Mock(),
+        get_extra_head_content=Mock(),
+        get_extra_body_content=Mock(),
+    )
+    _configure_routelit_stub(stub)
+    return stub
+
+
+def _configure_routelit_stub(stub):
+    """(Re)apply the default return values the adapter relies on."""
+    stub.get_builder_class.return_value.get_client_resource_paths.return_value = []
+    stub.default_client_assets.return_value = "default_assets"
+    stub.client_assets.return_value = "client_assets"
 
 
 class TestRunModeEnum:
@@ -21,39 +100,76 @@ class TestRunModeEnum:
         assert RunModeEnum.DEV_COMPONENTS.value == "dev_components"
 
 
+@pytest.mark.xdist_group("adapter")
 class TestRouteLitFlaskAdapter:
-    @pytest.fixture
+    """Grouped for xdist so the module-scoped flask_app stays on one worker.
+
+    Run with `pytest -n auto --dist loadgroup` to parallelize across files.
+    """
+
+    @pytest.fixture(scope="session")
     def mock_routelit(self):
-        """Create a mock RouteLit instance for testing."""
-        mock_rl = Mock(spec=RouteLit)
-        mock_builder = Mock()
-        mock_builder.get_client_resource_paths.return_value = []
-        mock_rl.get_builder_class.return_value = mock_builder
-        mock_rl.default_client_assets.return_value = "default_assets"
-        mock_rl.client_assets.return_value = "client_assets"
-        return mock_rl
+        """Create a RouteLit stub shared by the whole run; call state is reset below."""
+        return _make_routelit_stub()
+
+    @pytest.fixture(autouse=True)
+    def _reset_mock_routelit(self, mock_routelit):
+        """Wipe recorded calls and restore default return values between tests."""
+        yield
+        for attr in vars(mock_routelit).values():
+            attr.reset_mock(return_value=True, side_effect=True)
+        _configure_routelit_stub(mock_routelit)
 
     @pytest.fixture
+    def adapter(self, mock_routelit):
+        """A default-constructed adapter for tests that only dispatch methods."""
+        return RouteLitFlaskAdapter(mock_routelit)
+
+    @pytest.fixture(scope="session")
     def flask_app(self):
-        """Create a Flask app for testing."""
+        """Create a Flask app shared by the whole run; per-test state is reset below."""
         app = Flask(__name__)
-        app.config["TESTING"] = True
         return app
 
-    def test_init_default_values(self, mock_routelit):
+    @pytest.fixture(autouse=True)
+    def _reset_flask_app(self, flask_app):
+        """Restore the app state the tests and configure() mutate."""
+        saved_jinja_loader = flask_app.jinja_loader
+        saved_json_provider_class = flask_app.json_provider_class
+        saved_bytecode_cache = flask_app.jinja_env.bytecode_cache
+        saved_send_file_max_age = flask_app.config["SEND_FILE_MAX_AGE_DEFAULT"]
+        yield
+        flask_app.url_map = Map()
+        flask_app.view_functions = {}
+        flask_app.jinja_loader = saved_jinja_loader
+        flask_app.json_provider_class = saved_json_provider_class
+        # Drop the get_template stub the configure tests install and undo
+        # configure()'s environment/config side effects on the shared app.
+        flask_app.jinja_env.__dict__.pop("get_template", None)
+        flask_app.jinja_env.bytecode_cache = saved_bytecode_cache
+        flask_app.config["SEND_FILE_MAX_AGE_DEFAULT"] = saved_send_file_max_age
+        # Allow later tests to register routes after a test_client request
+        flask_app._got_first_request = False
+
+    @pytest.fixture(autouse=True)
+    def _clear_fs_loader_cache(self):
+        """Keep the memoized FileSystemLoader from leaking across tests."""
+        _fs_loader.cache_clear()
+
+    @pytest.fixture(autouse=True)
+    def adapter_deps(self, _adapter_patchers):
+        """Per-test view of the module-level patchers with clean call state."""
+        _adapter_patchers.send_from_directory.reset_mock(return_value=True, side_effect=True)
+        _adapter_patchers.fs_loader.reset_mock(return_value=True, side_effect=True)
+        return _adapter_patchers
+
+    def test_init_default_values(self, adapter, mock_routelit):
         """Test adapter initialization with default values."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
         assert adapter.routelit == mock_routelit
         assert adapter.run_mode == "prod"
         assert adapter.local_frontend_server is None
         assert adapter.local_components_server is None
-        assert adapter.cookie_config == {
-            "secure": True,
-            "samesite": "none",
-            "httponly": True,
-            "max_age": 60 * 60 * 24 * 1,  # 1 day
-        }
+        assert adapter.cookie_config == _EXPECTED_COOKIE_CONFIG
 
     def test_init_default_values_dev_mode(self, mock_routelit):
         """Test adapter initialization with default values in dev mode."""
@@ -121,12 +237,7 @@ class TestRouteLitFlaskAdapter:
         """Test adapter initialization with None cookie_config in production mode."""
         adapter = RouteLitFlaskAdapter(mock_routelit, cookie_config=None)
         # In production mode with None cookie_config, should use default production config
-        assert adapter.cookie_config == {
-            "secure": True,
-            "samesite": "none",
-            "httponly": True,
-            "max_age": 60 * 60 * 24 * 1,  # 1 day
-        }
+        assert adapter.cookie_config == _EXPECTED_COOKIE_CONFIG
 
     def test_init_dev_components_mode(self, mock_routelit):
         """Test adapter initialization in dev_components mode."""
@@ -150,92 +261,73 @@ class TestRouteLitFlaskAdapter:
         # In dev mode, cookie_config should be empty regardless of provided config
         assert adapter.cookie_config == {}
 
-    @patch("routelit_flask.adapter.send_from_directory")
-    def test_configure_static_assets(self, mock_send_from_directory, flask_app):
+    def test_configure_static_assets(self, flask_app):
         """Test static asset configuration."""
         asset_target: AssetTarget = {"package_name": "test_package", "path": "static/assets"}
+        before = {rule.rule for rule in flask_app.url_map.iter_rules()}
 
-        with patch("routelit_flask.adapter.resources.files") as mock_files:
-            mock_files.return_value.joinpath.return_value = "/mock/path"
+        RouteLitFlaskAdapter.configure_static_assets(flask_app, asset_target)
 
-            RouteLitFlaskAdapter.configure_static_assets(flask_app, asset_target)
+        # Check that URL rule was added by this call, not inherited from the app
+        new_rules = {rule.rule for rule in flask_app.url_map.iter_rules()} - before
+        assert "/routelit/test_package/<path:filename>" in new_rules
 
-            # Check that URL rule was added
-            assert any(rule.rule == "/routelit/test_package/<path:filename>" for rule in flask_app.url_map.iter_rules())
-
-    def test_configure_flask_app(self, mock_routelit, flask_app):
+    def test_configure_flask_app(self, adapter, mock_routelit, flask_app):
         """Test Flask app configuration."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader"),
-        ):
-            result = adapter.configure(flask_app)
+        flask_app.jinja_env.get_template = Mock()
+        before = {rule.rule for rule in flask_app.url_map.iter_rules()}
+        result = adapter.configure(flask_app)
 
-            # Check that the adapter is returned
-            assert result == adapter
+        # Check that the adapter is returned
+        assert result == adapter
 
-            # Check that JSON provider was set
-            assert flask_app.json_provider_class == CustomJSONProvider
+        # Check that JSON provider was set
+        assert flask_app.json_provider_class == CustomJSONProvider
 
-            # Check that assets URL rule was added
-            assert any(rule.rule == "/routelit/<path:filename>" for rule in flask_app.url_map.iter_rules())
+        # Check that assets URL rule was added by configure
+        new_rules = {rule.rule for rule in flask_app.url_map.iter_rules()} - before
+        assert "/routelit/<path:filename>" in new_rules
 
-    def test_configure_jinja_loader_with_choice_loader(self, mock_routelit, flask_app):
+    def test_configure_jinja_loader_with_choice_loader(self, adapter, flask_app, adapter_deps):
         """Test Jinja loader configuration when ChoiceLoader already exists."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
         # Set up existing ChoiceLoader
-        existing_loader = Mock()
-        choice_loader = ChoiceLoader([existing_loader])
+        choice_loader = ChoiceLoader([_EXISTING_LOADER])
         flask_app.jinja_loader = choice_loader
 
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader") as mock_fs_loader,
-        ):
-            mock_fs_instance = Mock()
-            mock_fs_loader.return_value = mock_fs_instance
+        adapter_deps.fs_loader.return_value = _FS_LOADER_INSTANCE
 
-            adapter.configure(flask_app)
+        flask_app.jinja_env.get_template = Mock()
+        adapter.configure(flask_app)
 
-            # Check that FileSystemLoader was appended to existing loaders
-            assert mock_fs_instance in choice_loader.loaders
+        # Check that FileSystemLoader was appended to existing loaders
+        assert _FS_LOADER_INSTANCE in choice_loader.loaders
 
-    def test_configure_jinja_loader_without_choice_loader(self, mock_routelit, flask_app):
+    def test_configure_jinja_loader_without_choice_loader(self, adapter, flask_app, adapter_deps):
         """Test Jinja loader configuration when no ChoiceLoader exists."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
         # Set up existing single loader
-        existing_loader = Mock()
-        flask_app.jinja_loader = existing_loader
-
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader") as mock_fs_loader,
-            patch("routelit_flask.adapter.ChoiceLoader", ChoiceLoader),
-        ):
-            mock_fs_instance = Mock()
-            mock_fs_loader.return_value = mock_fs_instance
-
-            adapter.configure(flask_app)
-
-            # Check that a ChoiceLoader was created with both loaders
-            assert isinstance(flask_app.jinja_loader, ChoiceLoader)
-            # Verify both loaders are present
-            assert existing_loader in flask_app.jinja_loader.loaders
-            assert mock_fs_instance in flask_app.jinja_loader.loaders
-
-    @patch("routelit_flask.adapter.render_template")
-    @patch("routelit_flask.adapter.make_response")
-    def test_handle_get_request(self, mock_make_response, mock_render_template, mock_routelit):
+        flask_app.jinja_loader = _EXISTING_LOADER
+
+        adapter_deps.fs_loader.return_value = _FS_LOADER_INSTANCE
+
+        flask_app.jinja_env.get_template = Mock()
+        adapter.configure(flask_app)
+
+        # Check that a ChoiceLoader was created with both loaders
+        assert isinstance(flask_app.jinja_loader, ChoiceLoader)
+        # Verify both loaders are present
+        assert _EXISTING_LOADER in flask_app.jinja_loader.loaders
+        assert _FS_LOADER_INSTANCE in flask_app.jinja_loader.loaders
+
+    def test_handle_get_request(self, monkeypatch, adapter, mock_routelit):
         """Test GET request handling."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
+        mock_render_template = Mock()
+        mock_make_response = Mock()
+        monkeypatch.setattr("routelit_flask.adapter.render_template", mock_render_template)
+        monkeypatch.setattr("routelit_flask.adapter.make_response", mock_make_response)
 
         # Mock request
-        mock_request = Mock(spec=FlaskRLRequest)
-        mock_request.get_session_id.return_value = "test_session_id"
+        # Only these two members are touched, so a namespace beats a spec'd Mock
+        mock_request = SimpleNamespace(get_session_id=lambda: "test_session_id", is_new_session=True)
 
         # Mock RouteLit response
         mock_response = Mock()
@@ -253,12 +345,12 @@ class TestRouteLitFlaskAdapter:
         mock_flask_response = Mock()
         mock_make_response.return_value = mock_flask_response
 
-        result = adapter._handle_get_request(Mock(), mock_request, kwarg1="value1")
+        result = adapter._handle_get_request(_noop_view, mock_request, kwarg1="value1")
 
         # Verify RouteLit was called correctly
         call_args = mock_routelit.handle_get_request.call_args[0]
         assert call_args[1] == mock_request
-        assert isinstance(call_args[0], Mock)
+        assert call_args[0] is _noop_view
         call_kwargs = mock_routelit.handle_get_request.call_args[1]
         assert call_kwargs["kwarg1"] == "value1"
 
@@ -282,163 +374,81 @@ class TestRouteLitFlaskAdapter:
         mock_flask_response.set_cookie.assert_called_once_with(
             "ROUTELIT_SESSION_ID",
             "test_session_id",
-            secure=True,
-            samesite="none",
-            httponly=True,
-            max_age=86400,
+            **_EXPECTED_COOKIE_CONFIG,
         )
 
         assert result == mock_flask_response
 
-    @patch("routelit_flask.adapter.jsonify")
-    def test_response_post_request(self, mock_jsonify, mock_routelit):
-        """Test POST request handling."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        view_fn = Mock()
-        mock_actions = ["action1", "action2"]
-        mock_routelit.handle_post_request.return_value = mock_actions
-
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "POST"
-            mock_flask_rl_request.return_value = mock_request_instance
-
-            result = adapter.response(view_fn, True, "arg1", kwarg1="value1")
-
-            # Verify RouteLit was called correctly
-            mock_routelit.handle_post_request.assert_called_once_with(
-                view_fn, mock_request_instance, True, "arg1", kwarg1="value1"
-            )
-
-            # Verify JSON response
-            mock_jsonify.assert_called_once_with(mock_actions)
-            assert result == mock_jsonify.return_value
-
-    def test_response_get_request(self, mock_routelit):
-        """Test GET request handling through response method."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        view_fn = Mock()
-
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch.object(adapter, "_handle_get_request") as mock_handle_get,
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "GET"
-            mock_flask_rl_request.return_value = mock_request_instance
-
-            mock_handle_get.return_value = "get_response"
-
-            result = adapter.response(view_fn, None, "arg1", kwarg1="value1")
+    @pytest.fixture
+    def response_mocks(self, monkeypatch):
+        """Patch the Flask request proxy and FlaskRLRequest for response() tests."""
+        flask_request = Mock()
+        rl_request = Mock()
+        factory = Mock(return_value=rl_request)
+        monkeypatch.setattr("routelit_flask.adapter.request", flask_request)
+        monkeypatch.setattr("routelit_flask.adapter.FlaskRLRequest", factory)
+        return SimpleNamespace(flask_request=flask_request, rl_request=rl_request, factory=factory)
+
+    @pytest.mark.parametrize(
+        ("adapter_method", "method"),
+        [
+            ("response", "POST"),
+            ("response", "GET"),
+            ("stream_response", "POST"),
+            ("stream_response", "GET"),
+        ],
+    )
+    def test_response_dispatch(self, adapter_method, method, adapter, mock_routelit, flask_app, response_mocks):
+        """Test that response()/stream_response() dispatch POST to RouteLit and GET to _handle_get_request."""
+        response_mocks.rl_request.method = method
+        dispatch = getattr(adapter, adapter_method)
+
+        if method == "GET":
+            with patch.object(adapter, "_handle_get_request") as mock_handle_get:
+                mock_handle_get.return_value = "get_response"
+
+                result = dispatch(_noop_view, None, "arg1", kwarg1="value1")
 
             # Verify GET handler was called
             mock_handle_get.assert_called_once()
-            call_args = mock_handle_get.call_args[0]
-            assert call_args[1] == mock_request_instance
+            assert mock_handle_get.call_args[0][1] == response_mocks.rl_request
             assert result == "get_response"
+        elif adapter_method == "response":
+            mock_actions = ["action1", "action2"]
+            mock_routelit.handle_post_request.return_value = mock_actions
 
-    def test_response_with_flask_rl_request_creation(self, mock_routelit):
-        """Test that FlaskRLRequest is created correctly."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        view_fn = Mock()
-
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch.object(adapter, "_handle_get_request"),
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "GET"
-            mock_flask_rl_request.return_value = mock_request_instance
-
-            adapter.response(view_fn)
-
-            # Verify FlaskRLRequest was created with Flask request
-            mock_flask_rl_request.assert_called_once_with(mock_flask_request)
-
-    @patch("routelit_flask.adapter.stream_with_context")
-    @patch("routelit_flask.adapter.Response")
-    def test_stream_response_post_request(self, mock_response, mock_stream_with_context, mock_routelit):
-        """Test POST request handling in stream_response method."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
+            with flask_app.app_context():
+                result = dispatch(_noop_view, True, "arg1", kwarg1="value1")
 
-        view_fn = Mock()
-        mock_stream_data = ["action1", "action2"]
-        mock_routelit.handle_post_request_stream_jsonl.return_value = mock_stream_data
-
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "POST"
-            mock_flask_rl_request.return_value = mock_request_instance
+            # Verify RouteLit was called correctly
+            mock_routelit.handle_post_request.assert_called_once_with(
+                _noop_view, response_mocks.rl_request, True, "arg1", kwarg1="value1"
+            )
 
-            mock_response_instance = Mock()
-            mock_response_instance.headers = {}
-            mock_response.return_value = mock_response_instance
+            # Verify the JSON response was built from the serialized actions
+            assert result.mimetype == "application/json"
+            assert result.get_json() == mock_actions
+        else:
+            mock_stream_data = ["action1", "action2"]
+            mock_routelit.handle_post_request_stream_jsonl.return_value = mock_stream_data
 
-            result = adapter.stream_response(view_fn, True, "arg1", kwarg1="value1")
+            with patch.multiple("routelit_flask.adapter", stream_with_context=DEFAULT, Response=DEFAULT) as mocks:
+                result = dispatch(_noop_view, True, "arg1", kwarg1="value1")
 
             # Verify RouteLit was called correctly
             mock_routelit.handle_post_request_stream_jsonl.assert_called_once_with(
-                view_fn, mock_request_instance, True, "arg1", kwarg1="value1"
+                _noop_view, response_mocks.rl_request, True, "arg1", kwarg1="value1"
             )
 
-            # Verify stream response was created
-            mock_stream_with_context.assert_called_once_with(mock_stream_data)
-            mock_response.assert_called_once_with(mock_stream_with_context.return_value, mimetype="text/event-stream")
-
-            # Verify headers were set
-            assert mock_response_instance.headers["Content-Type"] == "application/jsonlines"
-            assert result == mock_response_instance
-
-    def test_stream_response_get_request(self, mock_routelit):
-        """Test GET request handling through stream_response method."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        view_fn = Mock()
-
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch.object(adapter, "_handle_get_request") as mock_handle_get,
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "GET"
-            mock_flask_rl_request.return_value = mock_request_instance
-
-            mock_handle_get.return_value = "get_response"
-
-            result = adapter.stream_response(view_fn, None, "arg1", kwarg1="value1")
+            # Verify stream response was created with the final content type
+            mocks["stream_with_context"].assert_called_once_with(mock_stream_data)
+            mocks["Response"].assert_called_once_with(
+                mocks["stream_with_context"].return_value, mimetype="application/jsonlines"
+            )
+            assert result == mocks["Response"].return_value
 
-            # Verify GET handler was called
-            mock_handle_get.assert_called_once()
-            call_args = mock_handle_get.call_args[0]
-            assert call_args[1] == mock_request_instance
-            assert result == "get_response"
+        # In every variant, FlaskRLRequest wraps the active Flask request
+        response_mocks.factory.assert_called_once_with(response_mocks.flask_request)
 
     def test_handle_get_request_dev_mode(self, mock_routelit):
         """Test GET request handling in dev mode with local servers."""
@@ -450,8 +460,8 @@ class TestRouteLitFlaskAdapter:
         )
 
         # Mock request
-        mock_request = Mock(spec=FlaskRLRequest)
-        mock_request.get_session_id.return_value = "test_session_id"
+        # Only these two members are touched, so a namespace beats a spec'd Mock
+        mock_request = SimpleNamespace(get_session_id=lambda: "test_session_id", is_new_session=True)
 
         # Mock RouteLit response
         mock_response = Mock()
@@ -463,14 +473,11 @@ class TestRouteLitFlaskAdapter:
         mock_routelit.get_extra_head_content.return_value = "extra_head_content"
         mock_routelit.get_extra_body_content.return_value = "extra_body_content"
 
-        with (
-            patch("routelit_flask.adapter.render_template") as mock_render_template,
-            patch("routelit_flask.adapter.make_response") as mock_make_response,
-        ):
-            mock_flask_response = Mock()
-            mock_make_response.return_value = mock_flask_response
+        with patch.multiple("routelit_flask.adapter", render_template=DEFAULT, make_response=DEFAULT) as mocks:
+            mock_render_template = mocks["render_template"]
+            mock_flask_response = mocks["make_response"].return_value
 
-            adapter._handle_get_request(Mock(), mock_request, kwarg1="value1")
+            adapter._handle_get_request(_noop_view, mock_request, kwarg1="value1")
 
             # Verify template rendering with dev mode values
             mock_render_template.assert_called_once_with(
@@ -494,7 +501,7 @@ class TestRouteLitFlaskAdapter:
                 "test_session_id",
             )
 
-    def test_configure_with_multiple_static_paths(self, mock_routelit, flask_app):
+    def test_configure_with_multiple_static_paths(self, adapter, mock_routelit, flask_app):
         """Test configuration with multiple static asset paths."""
         # Mock multiple static paths
         mock_builder = Mock()
@@ -504,61 +511,44 @@ class TestRouteLitFlaskAdapter:
         ]
         mock_routelit.get_builder_class.return_value = mock_builder
 
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader"),
-            patch("routelit_flask.adapter.resources.files") as mock_files,
-        ):
-            mock_files.return_value.joinpath.return_value = "/mock/path"
-
-            adapter.configure(flask_app)
+        flask_app.jinja_env.get_template = Mock()
+        adapter.configure(flask_app)
 
-            # Check that both URL rules were added
-            rules = [rule.rule for rule in flask_app.url_map.iter_rules()]
-            assert "/routelit/package1/<path:filename>" in rules
-            assert "/routelit/package2/<path:filename>" in rules
-            assert "/routelit/<path:filename>" in rules
+        # Check that both URL rules were added; one scan, O(1) membership checks
+        rules = {rule.rule for rule in flask_app.url_map.iter_rules()}
+        assert "/routelit/package1/<path:filename>" in rules
+        assert "/routelit/package2/<path:filename>" in rules
+        assert "/routelit/<path:filename>" in rules
 
-    def test_configure_with_custom_json_provider(self, mock_routelit, flask_app):
+    def test_configure_with_custom_json_provider(self, adapter, mock_routelit, flask_app):
         """Test Flask app configuration with custom JSON provider."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
         custom_provider = type("CustomProvider", (JSONProvider,), {})
 
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader"),
-        ):
-            result = adapter.configure(flask_app, json_provider_class=custom_provider)
+        flask_app.jinja_env.get_template = Mock()
+        result = adapter.configure(flask_app, json_provider_class=custom_provider)
 
-            # Check that the adapter is returned
-            assert result == adapter
+        # Check that the adapter is returned
+        assert result == adapter
 
-            # Check that custom JSON provider was set
-            assert flask_app.json_provider_class == custom_provider
+        # Check that custom JSON provider was set
+        assert flask_app.json_provider_class == custom_provider
 
-    def test_configure_without_json_provider(self, mock_routelit, flask_app):
+    def test_configure_without_json_provider(self, adapter, mock_routelit, flask_app):
         """Test Flask app configuration with json_provider_class=False."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
         original_provider = flask_app.json_provider_class
 
-        with (
-            patch("routelit_flask.adapter.send_from_directory"),
-            patch("routelit_flask.adapter.FileSystemLoader"),
-        ):
-            result = adapter.configure(flask_app, json_provider_class=False)
+        flask_app.jinja_env.get_template = Mock()
+        result = adapter.configure(flask_app, json_provider_class=False)
 
-            # Check that the adapter is returned
-            assert result == adapter
+        # Check that the adapter is returned
+        assert result == adapter
 
-            # Check that JSON provider was not changed
-            assert flask_app.json_provider_class == original_provider
+        # Check that JSON provider was not changed
+        assert flask_app.json_provider_class == original_provider
 
-    def test_response_with_inject_builder(self, mock_routelit, flask_app):
+    def test_response_with_inject_builder(self, adapter, mock_routelit, flask_app):
         """Test response method with inject_builder parameter."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-        view_fn = Mock()
+        view_fn = _noop_view
         mock_actions = ["action1", "action2"]
         mock_routelit.handle_post_request.return_value = mock_actions
 
@@ -575,10 +565,9 @@ class TestRouteLitFlaskAdapter:
             mock_routelit.handle_post_request.assert_called_once()
             assert mock_routelit.handle_post_request.call_args[0][2] is True
 
-    def test_stream_response_with_inject_builder(self, mock_routelit, flask_app):
+    def test_stream_response_with_inject_builder(self, adapter, mock_routelit, flask_app):
         """Test stream_response method with inject_builder parameter."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-        view_fn = Mock()
+        view_fn = _noop_view
         mock_stream = iter(["action1", "action2"])
         mock_routelit.handle_post_request_stream_jsonl.return_value = mock_stream
 
@@ -605,25 +594,19 @@ class TestRouteLitFlaskAdapter:
         assert adapter.local_components_server is None
         assert adapter.cookie_config == {}
 
-    def test_handle_get_request_with_all_routelit_methods(self, mock_routelit):
+    def test_handle_get_request_with_all_routelit_methods(self, adapter, mock_routelit):
         """Test _handle_get_request calls all expected RouteLit methods."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
         # Mock request
-        mock_request = Mock(spec=FlaskRLRequest)
-        mock_request.get_session_id.return_value = "test_session_id"
+        # Only these two members are touched, so a namespace beats a spec'd Mock
+        mock_request = SimpleNamespace(get_session_id=lambda: "test_session_id", is_new_session=True)
         # Mock RouteLit response
         mock_response = Mock()
         mock_response.get_str_json_elements.return_value = "json_elements"
         mock_response.head.title = "Test Title"
         mock_response.head.description = "Test Description"
         mock_routelit.handle_get_request.return_value = mock_response
-        with (
-            patch("routelit_flask.adapter.render_template", return_value="rendered_template"),
-            patch("routelit_flask.adapter.make_response") as mock_make_response,
-        ):
-            mock_flask_response = Mock()
-            mock_make_response.return_value = mock_flask_response
-            adapter._handle_get_request(Mock(), mock_request)
+        with patch.multiple("routelit_flask.adapter", render_template=DEFAULT, make_response=DEFAULT):
+            adapter._handle_get_request(_noop_view, mock_request)
             # Verify all RouteLit methods were called
             mock_routelit.handle_get_request.assert_called_once()
             mock_routelit.default_client_assets.assert_called_once()
@@ -632,48 +615,26 @@ class TestRouteLitFlaskAdapter:
             mock_routelit.get_extra_head_content.assert_called_once()
             mock_routelit.get_extra_body_content.assert_called_once()
 
-    def test_response_with_args_and_kwargs(self, mock_routelit):
+    def test_response_with_args_and_kwargs(self, adapter, mock_routelit, response_mocks):
         """Test response method passes *args and **kwargs correctly."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-        view_fn = Mock()
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch.object(adapter, "_handle_get_request") as mock_handle_get,
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "GET"
-            mock_flask_rl_request.return_value = mock_request_instance
-            adapter.response(view_fn, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
-            # Verify args and kwargs were passed correctly to _handle_get_request
-            mock_handle_get.assert_called_once()
-            call_args = mock_handle_get.call_args
-            assert call_args[1] == {"kwarg1": "value1", "kwarg2": "value2"}
-
-    def test_stream_response_with_args_and_kwargs(self, mock_routelit):
+        response_mocks.rl_request.method = "GET"
+        with patch.object(adapter, "_handle_get_request") as mock_handle_get:
+            adapter.response(_noop_view, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
+        # Verify args and kwargs were passed correctly to _handle_get_request
+        mock_handle_get.assert_called_once()
+        assert mock_handle_get.call_args[1] == {"kwarg1": "value1", "kwarg2": "value2"}
+
+    def test_stream_response_with_args_and_kwargs(self, adapter, mock_routelit, response_mocks):
         """Test stream_response method passes *args and **kwargs correctly."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-        view_fn = Mock()
         mock_stream_data = ["action1", "action2"]
         mock_routelit.handle_post_request_stream_jsonl.return_value = mock_stream_data
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch("routelit_flask.adapter.stream_with_context"),
-            patch("routelit_flask.adapter.Response"),
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "POST"
-            mock_flask_rl_request.return_value = mock_request_instance
-            adapter.stream_response(view_fn, True, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
-            # Verify args and kwargs were passed correctly
-            mock_routelit.handle_post_request_stream_jsonl.assert_called_once_with(
-                view_fn, mock_request_instance, True, "arg1", "arg2", kwarg1="value1", kwarg2="value2"
-            )
+        response_mocks.rl_request.method = "POST"
+        with patch.multiple("routelit_flask.adapter", stream_with_context=DEFAULT, Response=DEFAULT):
+            adapter.stream_response(_noop_view, True, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
+        # Verify args and kwargs were passed correctly
+        mock_routelit.handle_post_request_stream_jsonl.assert_called_once_with(
+            _noop_view, response_mocks.rl_request, True, "arg1", "arg2", kwarg1="value1", kwarg2="value2"
+        )
 
     def test_handle_get_request_with_custom_cookie_config(self, mock_routelit):
         """Test _handle_get_request with custom cookie configuration."""
@@ -685,21 +646,17 @@ class TestRouteLitFlaskAdapter:
         }
         adapter = RouteLitFlaskAdapter(mock_routelit, cookie_config=custom_cookie_config)
         # Mock request
-        mock_request = Mock(spec=FlaskRLRequest)
-        mock_request.get_session_id.return_value = "test_session_id"
+        # Only these two members are touched, so a namespace beats a spec'd Mock
+        mock_request = SimpleNamespace(get_session_id=lambda: "test_session_id", is_new_session=True)
         # Mock RouteLit response
         mock_response = Mock()
         mock_response.get_str_json_elements.return_value = "json_elements"
         mock_response.head.title = "Test Title"
         mock_response.head.description = "Test Description"
         mock_routelit.handle_get_request.return_value = mock_response
-        with (
-            patch("routelit_flask.adapter.render_template", return_value="rendered_template"),
-            patch("routelit_flask.adapter.make_response") as mock_make_response,
-        ):
-            mock_flask_response = Mock()
-            mock_make_response.return_value = mock_flask_response
-            adapter._handle_get_request(Mock(), mock_request)
+        with patch.multiple("routelit_flask.adapter", render_template=DEFAULT, make_response=DEFAULT) as mocks:
+            mock_flask_response = mocks["make_response"].return_value
+            adapter._handle_get_request(_noop_view, mock_request)
             # Verify cookie was set with custom config
             mock_flask_response.set_cookie.assert_called_once_with(
                 "ROUTELIT_SESSION_ID",
@@ -710,27 +667,17 @@ class TestRouteLitFlaskAdapter:
                 max_age=3600,
             )
 
-    def test_response_post_request_with_args_and_kwargs(self, mock_routelit):
+    def test_response_post_request_with_args_and_kwargs(self, adapter, mock_routelit, flask_app, response_mocks):
         """Test POST request handling with args and kwargs."""
-        adapter = RouteLitFlaskAdapter(mock_routelit)
-        view_fn = Mock()
         mock_actions = ["action1", "action2"]
         mock_routelit.handle_post_request.return_value = mock_actions
-        # Create a mock Flask request
-        mock_flask_request = Mock()
-        with (
-            patch("routelit_flask.adapter.request", mock_flask_request),
-            patch("routelit_flask.adapter.FlaskRLRequest") as mock_flask_rl_request,
-            patch("routelit_flask.adapter.jsonify", return_value="json_response"),
-        ):
-            mock_request_instance = Mock()
-            mock_request_instance.method = "POST"
-            mock_flask_rl_request.return_value = mock_request_instance
-            adapter.response(view_fn, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
-            # Verify args and kwargs were passed correctly
-            mock_routelit.handle_post_request.assert_called_once_with(
-                view_fn, mock_request_instance, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2"
-            )
+        response_mocks.rl_request.method = "POST"
+        with flask_app.app_context():
+            adapter.response(_noop_view, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2")
+        # Verify args and kwargs were passed correctly
+        mock_routelit.handle_post_request.assert_called_once_with(
+            _noop_view, response_mocks.rl_request, None, "arg1", "arg2", kwarg1="value1", kwarg2="value2"
+        )
 
     def test_static_path_custom_value(self, mock_routelit):
         """Test static_path can be set with custom value."""
@@ -748,53 +695,142 @@ class TestRouteLitFlaskAdapter:
         """Test configure_static_assets with invalid asset target."""
         # Asset target missing required keys
         invalid_asset_target = {}
-        with (
-            pytest.raises(KeyError),
-            patch("routelit_flask.adapter.resources.files") as mock_files,
-        ):
-            mock_files.return_value.joinpath.return_value = "/mock/path"
+        with pytest.raises(KeyError):
             RouteLitFlaskAdapter.configure_static_assets(flask_app, invalid_asset_target)
 
 
+class TestProdShellIntegration:
+    """Render the prod shell path against the real routelit index.html.
+
+    The adapter tests above stub template rendering, so they cannot catch
+    escaping or template-branch regressions in the baked shell; these tests
+    run configure() + _render_index with the actual template.
+    """
+
+    @pytest.fixture
+    def integration_adapter(self):
+        """A configured prod adapter whose app loads the real routelit templates."""
+        routelit_stub = _make_routelit_stub()
+        routelit_stub.client_assets.return_value = []
+        routelit_stub.get_importmap_json.return_value = "{}"
+        routelit_stub.get_extra_head_content.return_value = ""
+        routelit_stub.get_extra_body_content.return_value = ""
+        app = Flask(__name__)
+        # Resolve the templates dir from the package directly: the session-wide
+        # resources patch and the module-level FileSystemLoader patcher both
+        # bypass the adapter's own template resolution in this module.
+        templates_dir = str(Path(routelit.__file__).parent / "templates")
+        app.jinja_loader = ChoiceLoader([FileSystemLoader(templates_dir)])
+        return RouteLitFlaskAdapter(routelit_stub).configure(app)
+
+    @staticmethod
+    def _render(adapter, title=None, description=None, elements=None):
+        elements = elements if elements is not None else []
+        rl_response = SimpleNamespace(
+            elements=elements,
+            get_str_json_elements=lambda: json.dumps(elements),
+            head=SimpleNamespace(title=title, description=description),
+        )
+        return adapter._render_index(rl_response)
+
+    def test_routelit_data_round_trips(self, integration_adapter):
+        """Element data survives the shell substitution, including hostile props."""
+        elements = [
+            {
+                "name": "text",
+                "props": {
+                    "label": '"><script>alert(1)</script>',
+                    "sentinels": "__RL_TITLE__ __RL_DESC__",
+                },
+                "key": "k1",
+            }
+        ]
+        assert integration_adapter._index_shell is not None
+        rendered = self._render(integration_adapter, title="My Title", description="My description", elements=elements)
+
+        match = re.search(r'<input id="routelit-data" type="hidden" value="(.*?)" />', rendered)
+        assert match is not None
+        assert json.loads(html.unescape(match.group(1))) == elements
+        # The payload must never land unescaped in the markup
+        assert "<script>alert(1)</script>" not in rendered
+
+    def test_head_values_are_escaped(self, integration_adapter):
+        """Title/description land in the markup exactly as Jinja would escape them."""
+        rendered = self._render(integration_adapter, title='T & "quoted" <b>', description="D")
+
+        assert "<title>T &amp; &#34;quoted&#34; &lt;b&gt;</title>" in rendered
+
+    def test_falsy_head_matches_template_fallbacks(self, integration_adapter):
+        """Default Head() renders the template's fallback title and no description tag."""
+        rendered = self._render(integration_adapter)
+
+        assert "<title>Routelit</title>" in rendered
+        assert 'name="description"' not in rendered
+        assert "__RL_" not in rendered
+
+
 class TestFlaskRLRequest:
     """Test the FlaskRLRequest class."""
 
-    @pytest.fixture
-    def mock_flask_request(self):
-        """Create a mock Flask request for testing."""
-        mock_request = Mock()
+    @staticmethod
+    def _configure_flask_request(mock_request):
+        """(Re)apply the default request attributes individual tests mutate."""
         mock_request.headers = {"Content-Type": "application/json", "Referer": "http://example.com"}
         mock_request.view_args = {"id": "123"}
         mock_request.referrer = "http://example.com"
         mock_request.method = "GET"
-        mock_request.json = {"key": "value"}
+        mock_request.get_json.return_value = {"key": "value"}
         mock_request.is_json = True
+        mock_request.content_type = "application/json"
         mock_request.args = {"param1": "value1", "param2": ["value2", "value3"]}
         mock_request.path = "/test/path"
         mock_request.host = "example.com"
         mock_request.cookies = {"ROUTELIT_SESSION_ID": "existing_session_id"}
-        return mock_request
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_flask_request(cls):
+        """Create a mock Flask request shared by the class; defaults reset below."""
+        return Mock()
+
+    @pytest.fixture(autouse=True)
+    def _reset_flask_request(self, mock_flask_request):
+        """Restore the shared request mock to its default shape before each test."""
+        mock_flask_request.reset_mock(return_value=True, side_effect=True)
+        self._configure_flask_request(mock_flask_request)
 
     def test_init(self, mock_flask_request):
         """Test FlaskRLRequest initialization."""
         rl_request = FlaskRLRequest(mock_flask_request)
 
         assert rl_request.request == mock_flask_request
-        assert rl_request._FlaskRLRequest__default_session_id is not None
-
-    def test_get_headers(self, mock_flask_request):
-        """Test get_headers method."""
+        # The default session id is generated lazily, not at construction time
+        assert rl_request._FlaskRLRequest__default_session_id is None
+
+    @pytest.mark.parametrize(
+        ("accessor", "expected"),
+        [
+            pytest.param(
+                lambda r: r.get_headers(),
+                {"Content-Type": "application/json", "Referer": "http://example.com"},
+                id="get_headers",
+            ),
+            pytest.param(lambda r: r.get_path_params(), {"id": "123"}, id="get_path_params"),
+            pytest.param(lambda r: r.get_referrer(), "http://example.com", id="get_referrer"),
+            pytest.param(lambda r: r.method, "GET", id="method"),
+            pytest.param(lambda r: r.get_json(), {"key": "value"}, id="get_json"),
+            pytest.param(lambda r: r.is_json(), True, id="is_json"),
+            pytest.param(lambda r: r.get_query_param("param1"), "value1", id="get_query_param"),
+            pytest.param(lambda r: r.get_pathname(), "/test/path", id="get_pathname"),
+            pytest.param(lambda r: r.get_host(), "example.com", id="get_host"),
+            pytest.param(lambda r: r.get_session_id(), "existing_session_id", id="get_session_id"),
+        ],
+    )
+    def test_getters(self, accessor, expected, mock_flask_request):
+        """Test the simple getters against the default request attributes."""
         rl_request = FlaskRLRequest(mock_flask_request)
 
-        headers = rl_request.get_headers()
-        assert headers == mock_flask_request.headers
-
-    def test_get_path_params(self, mock_flask_request):
-        """Test get_path_params method."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        params = rl_request.get_path_params()
-        assert params == {"id": "123"}
+        assert accessor(rl_request) == expected
 
     def test_get_path_params_none(self, mock_flask_request):
         """Test get_path_params method when view_args is None."""
@@ -804,13 +840,6 @@ class TestFlaskRLRequest:
         params = rl_request.get_path_params()
         assert params is None
 
-    def test_get_referrer_from_referrer(self, mock_flask_request):
-        """Test get_referrer method using request.referrer."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        referrer = rl_request.get_referrer()
-        assert referrer == "http://example.com"
-
     def test_get_referrer_from_headers(self, mock_flask_request):
         """Test get_referrer method using headers when referrer is None."""
         mock_flask_request.referrer = None
@@ -828,19 +857,6 @@ class TestFlaskRLRequest:
         referrer = rl_request.get_referrer()
         assert referrer is None
 
-    def test_method_property(self, mock_flask_request):
-        """Test method property."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        assert rl_request.method == "GET"
-
-    def test_get_json_when_is_json(self, mock_flask_request):
-        """Test get_json method when request is JSON."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        json_data = rl_request.get_json()
-        assert json_data == {"key": "value"}
-
     def test_get_json_when_not_json(self, mock_flask_request):
         """Test get_json method when request is not JSON."""
         mock_flask_request.is_json = False
@@ -851,19 +867,6 @@ class TestFlaskRLRequest:
         json_data = rl_request.get_json()
         assert json_data is None
 
-    def test_is_json_property(self, mock_flask_request):
-        """Test is_json property."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        assert rl_request.is_json() is True
-
-    def test_get_query_param(self, mock_flask_request):
-        """Test get_query_param method."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        param = rl_request.get_query_param("param1")
-        assert param == "value1"
-
     def test_get_query_param_not_found(self, mock_flask_request):
         """Test get_query_param method when parameter is not found."""
         rl_request = FlaskRLRequest(mock_flask_request)
@@ -882,13 +885,6 @@ class TestFlaskRLRequest:
         mock_flask_request.args.getlist.assert_called_once_with("param2")
         assert params == ["value2", "value3"]
 
-    def test_get_session_id_existing(self, mock_flask_request):
-        """Test get_session_id method when session ID exists in cookies."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        session_id = rl_request.get_session_id()
-        assert session_id == "existing_session_id"
-
     def test_get_session_id_default(self, mock_flask_request):
         """Test get_session_id method when session ID doesn't exist in cookies."""
         mock_flask_request.cookies = {}
@@ -897,71 +893,61 @@ class TestFlaskRLRequest:
         session_id = rl_request.get_session_id()
         assert session_id == rl_request._FlaskRLRequest__default_session_id
 
-    def test_get_pathname(self, mock_flask_request):
-        """Test get_pathname method."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        pathname = rl_request.get_pathname()
-        assert pathname == "/test/path"
-
-    def test_get_host(self, mock_flask_request):
-        """Test get_host method."""
-        rl_request = FlaskRLRequest(mock_flask_request)
-
-        host = rl_request.get_host()
-        assert host == "example.com"
-
 
 class TestCustomJSONProvider:
     """Test the CustomJSONProvider class."""
 
-    @pytest.fixture
-    def json_provider(self):
-        """Create a CustomJSONProvider instance for testing."""
-        mock_app = Mock()
-        return CustomJSONProvider(mock_app)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def json_provider(cls):
+        """Create a CustomJSONProvider instance shared across the class.
+
+        The provider is stateless and no test inspects the app, so one
+        instance built from a plain spec-less Mock serves every test.
+        """
+        return CustomJSONProvider(Mock())
 
     def test_dumps_with_default_kwargs(self, json_provider):
-        """Test dumps method with default kwargs."""
+        """Test dumps method with default kwargs uses the fast path."""
         data = {"key": "value"}
 
-        with patch("json.dumps") as mock_dumps:
-            json_provider.dumps(data)
+        result = json_provider.dumps(data)
 
-            mock_dumps.assert_called_once()
-            call_kwargs = mock_dumps.call_args[1]
-            assert call_kwargs["skipkeys"] is True
-            assert call_kwargs["default"] == json_provider._default
+        assert result == '{"key":"value"}'
+
+        # Objects are serialized from __dict__ with None attributes dropped
+        holder = SimpleNamespace(name="test", none_value=None)
+        assert json.loads(json_provider.dumps(holder)) == {"name": "test"}
 
     def test_dumps_with_custom_kwargs(self, json_provider):
-        """Test dumps method with custom kwargs."""
-        data = {"key": "value"}
+        """Test dumps method with custom kwargs takes the stdlib fallback."""
+        data = {"b": 2, "a": 1}
 
-        with patch("json.dumps") as mock_dumps:
-            json_provider.dumps(data, indent=2, sort_keys=True)
+        result = json_provider.dumps(data, indent=2, sort_keys=True)
 
-            mock_dumps.assert_called_once()
-            call_kwargs = mock_dumps.call_args[1]
-            assert call_kwargs["skipkeys"] is True
-            assert call_kwargs["default"] == json_provider._default
-            assert call_kwargs["indent"] == 2
-            assert call_kwargs["sort_keys"] is True
+        assert json.loads(result) == data
+        assert "\n  " in result  # indent took effect
+        assert result.index('"a"') < result.index('"b"')  # sort_keys took effect
 
     def test_default_with_dict_attribute(self, json_provider):
         """Test _default method with object that has __dict__."""
-
-        class TestObject:
-            def __init__(self):
-                self.name = "test"
-                self.value = 123
-                self.none_value = None
-
-        obj = TestObject()
+        obj = SimpleNamespace(name="test", value=123, none_value=None)
         result = json_provider._default(obj)
 
         # Should only include non-None values
         assert result == {"name": "test", "value": 123}
 
+    def test_default_with_json_method(self, json_provider):
+        """Test _default method prefers a __json__ method when present."""
+
+        class JsonObject:
+            def __json__(self):
+                return {"precomputed": True}
+
+        result = json_provider._default(JsonObject())
+
+        assert result == {"precomputed": True}
+
     def test_default_without_dict_attribute(self, json_provider):
         """Test _default method with object that doesn't have __dict__."""
         obj = "string_object"
@@ -976,28 +962,34 @@ class TestCustomJSONProvider:
 class TestUtils:
     """Test utility functions."""
 
-    @patch("routelit_flask.utils.resources.files")
-    def test_get_default_static_path(self, mock_files):
-        """Test get_default_static_path function."""
-        mock_files.return_value.joinpath.return_value = "/mock/static/path"
+    @pytest.fixture(autouse=True)
+    def _resources(self):
+        """Expose the session-wide resources.files mock with per-test call state.
+
+        routelit_flask.utils and .adapter alias the same importlib.resources
+        module, so the session patch from _patch_resources already covers both.
+        """
+        _RESOURCES_MOCK.reset_mock(return_value=True, side_effect=True)
+        yield _RESOURCES_MOCK
+        _RESOURCES_MOCK.reset_mock(return_value=True, side_effect=True)
+        _RESOURCES_MOCK.return_value.joinpath.return_value = "/mock/path"
 
-        from routelit_flask.utils import get_default_static_path
+    def test_get_default_static_path(self, _resources):
+        """Test get_default_static_path function."""
+        _resources.return_value.joinpath.return_value = "/mock/static/path"
 
         result = get_default_static_path()
 
-        mock_files.assert_called_once_with("routelit")
-        mock_files.return_value.joinpath.assert_called_once_with("static")
+        _resources.assert_called_once_with("routelit")
+        _resources.return_value.joinpath.assert_called_once_with("static")
         assert result == "/mock/static/path"
 
-    @patch("routelit_flask.utils.resources.files")
-    def test_get_default_template_path(self, mock_files):
+    def test_get_default_template_path(self, _resources):
         """Test get_default_template_path function."""
-        mock_files.return_value.joinpath.return_value = "/mock/template/path"
-
-        from routelit_flask.utils import get_default_template_path
+        _resources.return_value.joinpath.return_value = "/mock/template/path"
 
         result = get_default_template_path()
 
-        mock_files.assert_called_once_with("routelit")
-        mock_files.return_value.joinpath.assert_called_once_with("templates")
+        _resources.assert_called_once_with("routelit")
+        _resources.return_value.joinpath.assert_called_once_with("templates")
         assert result == "/mock/template/path"
@@ -0,0 +1,10 @@
+"""Shared test configuration.
+
+Environment tweaks live here so they apply before any Flask import,
+including in xdist workers.
+"""
+
+import os
+
+# Skip python-dotenv discovery (a filesystem walk per app run) in tests.
+os.environ.setdefault("FLASK_SKIP_DOTENV", "1")
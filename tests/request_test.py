@@ -396,6 +396,23 @@ class TestFlaskRLRequest:
             # Should generate a valid UUID
             uuid.UUID(session_id)
 
+    # Test is_new_session
+    def test_is_new_session_true_when_id_generated(self, flask_app):
+        """Test is_new_session is True after a default session id was minted."""
+        with flask_app.test_request_context(method="GET"):
+            flask_rl_request = FlaskRLRequest(request)
+            flask_rl_request.get_session_id()
+
+            assert flask_rl_request.is_new_session is True
+
+    def test_is_new_session_false_with_existing_cookie(self, flask_app):
+        """Test is_new_session is False when the client sent a session cookie."""
+        with flask_app.test_request_context(headers={"Cookie": "ROUTELIT_SESSION_ID=existing_session_id"}):
+            flask_rl_request = FlaskRLRequest(request)
+            flask_rl_request.get_session_id()
+
+            assert flask_rl_request.is_new_session is False
+
     # Test get_pathname
     def test_get_pathname(self, flask_app):
         """Test get_pathname returns request path."""